@@ -21,18 +21,25 @@ Bus discovery::
     from ethercat_master import EtherCATBus
     slaves = EtherCATBus.discover(adapter=r"\\Device\\NPF_{...}")
 
+Submodules are imported lazily on first use.  Long-running processes that
+prefer to pay the import cost up front can call :func:`preload` at startup.
+
 :copyright: (c) Henschel Robotics GmbH
 :license: MIT
 """
 
-from .bus import EtherCATBus, register_emergency_callbacks
-from .slave import GenericSlave
-from .pdo import load_pdo_config, get_slave_pdo, configure_pdo_mapping
-from .exceptions import EtherCATError, ConnectionError, CommunicationError, ConfigurationError
-from .network_test import NetworkLatencyTest
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bus import EtherCATBus, register_emergency_callbacks
+    from .slave import GenericSlave
+    from .pdo import load_pdo_config, get_slave_pdo, configure_pdo_mapping
+    from .exceptions import EtherCATError, ConnectionError, CommunicationError, ConfigurationError
+    from .network_test import NetworkLatencyTest
 
 __version__ = "0.1.7"
-__all__ = [
+__all__ = (
     "EtherCATBus",
     "register_emergency_callbacks",
     "GenericSlave",
@@ -44,5 +51,47 @@ __all__ = [
     "ConnectionError",
     "CommunicationError",
     "ConfigurationError",
+    "preload",
     "__version__",
-]
+)
+
+# Public name -> submodule.  Submodules (and PySOEM with them) are imported
+# on first attribute access (PEP 562), so ``import ethercat_master`` stays cheap
+# for short-lived tools that only touch part of the API.
+_MAP = {
+    "EtherCATBus": "bus",
+    "register_emergency_callbacks": "bus",
+    "GenericSlave": "slave",
+    "NetworkLatencyTest": "network_test",
+    "load_pdo_config": "pdo",
+    "get_slave_pdo": "pdo",
+    "configure_pdo_mapping": "pdo",
+    "EtherCATError": "exceptions",
+    "ConnectionError": "exceptions",
+    "CommunicationError": "exceptions",
+    "ConfigurationError": "exceptions",
+}
+
+
+def preload():
+    """Import all submodules now instead of on first attribute access.
+
+    Useful for long-running master processes (daemons, the web server) that
+    want the import cost paid once at startup rather than on the first cycle.
+    """
+    for name in _MAP:
+        __getattr__(name)
+
+
+def __getattr__(name):
+    try:
+        module_name = _MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(__all__)
@@ -14,7 +14,8 @@ Architecture
     ├── pysoem.Master          (adapter handle)
     ├── ProcessData thread     (1 ms — raw frame send/receive)
     ├── PDO Update thread      (configurable — decode RX, encode TX per slave)
-    └── State Check thread     (300 ms — health monitoring, auto-reconnect)
+    ├── State Check thread     (300 ms — health monitoring, auto-reconnect)
+    └── Log thread             (prints messages queued by the threads above)
 
 Slave handles register via ``register_slave()`` and must implement:
 ``slave_index``, ``configure()``, ``pdo_update()``, ``seed_tx()``,
@@ -37,9 +38,15 @@ Bus discovery (no OP transition)::
 
 """
 
+import copy
+import ctypes
+import ctypes.util
+import hashlib
 import json
 import os
+import queue
 import struct
+import sys
 import threading
 import time
 from pathlib import Path
@@ -54,6 +61,7 @@ from .pdo import (
     get_slave_startup,
     apply_startup_sdos,
     pdo_mapping_exists,
+    read_config_file,
     sanitize_invalid_pdo_assignments,
     slave_supports_coe_pdo_mapping,
     slave_supports_pdo_assignment,
@@ -69,16 +77,229 @@ _EC_STATES = {
     pysoem.OP_STATE:     "OP",
 }
 
+_AL_STATUS_CODES = {
+    0x0000: "No error",
+    0x0001: "Unspecified error",
+    0x0003: "Invalid device setup (modular: 0xF030 != detected 0xF050)",
+    0x0011: "Invalid requested state change",
+    0x0012: "Unknown requested state",
+    0x0013: "Bootstrap not supported",
+    0x0014: "No valid firmware",
+    0x0015: "Invalid mailbox configuration (BOOT)",
+    0x0016: "Invalid mailbox configuration (PREOP)",
+    0x0017: "Invalid sync manager configuration",
+    0x0018: "No valid inputs available",
+    0x0019: "No valid outputs",
+    0x001A: "Synchronization error",
+    0x001B: "Sync manager watchdog",
+    0x001C: "Invalid sync manager types",
+    0x001D: "Invalid output configuration",
+    0x001E: "Invalid input configuration",
+    0x001F: "Invalid watchdog configuration",
+    0x0020: "Slave needs cold start",
+    0x0021: "Slave needs INIT",
+    0x0022: "Slave needs PREOP",
+    0x0023: "Slave needs SAFEOP",
+    0x0024: "Invalid input mapping",
+    0x0025: "Invalid output mapping",
+    0x0026: "Inconsistent settings",
+    0x0027: "FreeRun not supported",
+    0x0028: "SyncMode not supported",
+    0x0029: "FreeRun needs 3-buffer mode",
+    0x002A: "Background watchdog",
+    0x002B: "No valid inputs and outputs",
+    0x002C: "Fatal sync error",
+    0x002D: "No sync error",
+    0x002E: "Invalid input FMMU configuration",
+    0x0030: "Invalid DC sync configuration",
+    0x0031: "Invalid DC latch configuration",
+    0x0032: "PLL error",
+    0x0033: "DC sync I/O error",
+    0x0034: "DC sync timeout",
+    0x0035: "DC invalid sync cycle time",
+    0x0036: "DC sync0 cycle time",
+    0x0037: "DC sync1 cycle time",
+    0x0041: "MBX_AOE",
+    0x0042: "MBX_EOE",
+    0x0043: "MBX_COE",
+    0x0044: "MBX_FOE",
+    0x0045: "MBX_SOE",
+    0x004F: "MBX_VOE",
+    0x0050: "EEPROM no access",
+    0x0051: "EEPROM error",
+    0x0060: "Slave restarted locally",
+    0x0061: "Device identification value updated",
+    0x0070: "Invalid module configuration (0xF030 != 0xF050)",
+    0x00F0: "Application controller available",
+}
+
+
+# Consecutive bad working-counter samples before a slave state poll is
+# triggered (ProcessData cycles in the PD thread, 300 ms samples in the
+# State Check thread).
+_WKC_DEBOUNCE = 3
+
+
+def _lookup_table(mapping):
+    """Expand a small-int keyed dict into a tuple indexed by key (``None`` gaps)."""
+    table = [None] * (max(mapping) + 1)
+    for code, text in mapping.items():
+        table[code] = text
+    return tuple(table)
+
+
+# Contiguous tables for the small-int codes above: one bounds check and an
+# index instead of a hash probe on every state/diagnostic lookup.
+_EC_STATE_NAMES = _lookup_table(_EC_STATES)
+_AL_TEXT = _lookup_table(_AL_STATUS_CODES)
+_AL_HEX = tuple(f"0x{code:04X}" for code in range(len(_AL_TEXT)))
+
+# Preformatted PDO indices (0x1600..0x1A0F) used throughout discovery output.
+_PDO_IDX_HEX = {i: f"0x{i:04X}" for i in range(0x1600, 0x1A10)}
+
+
+def _hex16(value):
+    """Format a 16-bit CoE index as ``"0xNNNN"``, preformatted when possible."""
+    return _PDO_IDX_HEX.get(value) or f"0x{value:04X}"
+
+
+# Entry layouts of the CoE array objects read with complete access:
+# PDO assignment (0x1C12/0x1C13) and PDO mapping (0x16xx/0x1Axx).
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
 
 def _state_name(state_code):
     """Human-readable EtherCAT state from a raw state code."""
     base = state_code & ~pysoem.STATE_ACK
-    name = _EC_STATES.get(base, f"0x{state_code:02X}")
+    name = _EC_STATE_NAMES[base] if base < len(_EC_STATE_NAMES) else None
+    if name is None:
+        name = f"0x{state_code:02X}"
     if state_code & pysoem.STATE_ACK:
         name += "+ERR"
     return name
 
 
+def _al_status_text(code):
+    """Description of an AL status code, or ``None`` if unknown."""
+    return _AL_TEXT[code] if 0 <= code < len(_AL_TEXT) else None
+
+
+_CLOCK_MONOTONIC = 1
+_TIMER_ABSTIME = 1
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+_MCL_CURRENT = 1
+_MCL_FUTURE = 2
+
+
+def _load_libc():
+    """Return the C library via ctypes on Linux, or ``None`` elsewhere."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+
+
+def _bind_clock_nanosleep(libc):
+    """Return libc ``clock_nanosleep`` with its prototype set, if available."""
+    fn = getattr(libc, "clock_nanosleep", None) if libc is not None else None
+    if fn is None:
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_int,
+                   ctypes.POINTER(_Timespec), ctypes.POINTER(_Timespec)]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_libc = _load_libc()
+_clock_nanosleep = _bind_clock_nanosleep(_libc)
+
+
+def _sleep_until(deadline_ns):
+    """Sleep until the absolute ``time.monotonic_ns()`` *deadline_ns*.
+
+    On Linux this blocks in ``clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME)``
+    so wake-ups are phase-locked to the deadline instead of drifting by the
+    loop's work time.  Elsewhere it falls back to a relative ``time.sleep``
+    for the remaining interval (high-resolution waitable timer on Windows
+    with Python >= 3.11).
+    """
+    if _clock_nanosleep is not None:
+        ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+        _clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None)
+        return
+    delay = deadline_ns - time.monotonic_ns()
+    if delay > 0:
+        time.sleep(delay / 1e9)
+
+
+def _next_deadline(deadline_ns, period_ns):
+    """Advance *deadline_ns* by one period, resyncing if the loop overran."""
+    deadline_ns += period_ns
+    now = time.monotonic_ns()
+    if deadline_ns < now:
+        deadline_ns = now
+    return deadline_ns
+
+
+def _set_thread_realtime(priority, cpu=None, log=print):
+    """Best-effort ``SCHED_FIFO`` + CPU pinning for the calling thread (Linux).
+
+    On Linux, pid ``0`` in ``sched_setaffinity`` / ``sched_setscheduler``
+    refers to the calling thread, so this must run inside the target thread.
+    Returns True on success; failures (non-Linux, missing ``CAP_SYS_NICE``,
+    invalid CPU) are logged and the thread keeps its default policy.
+    Bus threads pass their non-blocking ``log`` so stdout cannot stall them.
+    """
+    if not hasattr(os, "sched_setscheduler"):
+        return False
+    name = threading.current_thread().name
+    try:
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except (OSError, ValueError) as exc:
+        log(f"[BUS] {name}: real-time scheduling unavailable: {exc}")
+        return False
+    log(f"[BUS] {name}: SCHED_FIFO priority {priority}"
+        + (f" on CPU {cpu}" if cpu is not None else ""))
+    return True
+
+
+def _lock_memory():
+    """Lock current and future pages in RAM (``mlockall``) to avoid page faults."""
+    if _libc is None or not hasattr(_libc, "mlockall"):
+        return False
+    if _libc.mlockall(_MCL_CURRENT | _MCL_FUTURE) != 0:
+        err = ctypes.get_errno()
+        print(f"[BUS] mlockall failed: {os.strerror(err)}")
+        return False
+    return True
+
+
+def _slave_io_sizes(slave):
+    """Return ``(output_bytes, input_bytes)`` of a pysoem slave.
+
+    Uses the ``Obytes`` / ``Ibytes`` size fields when the PySOEM build
+    exposes them, otherwise the length of the process-data buffers (no
+    extra ``bytes()`` copy of the process image).
+    """
+    out_sz = getattr(slave, "Obytes", None)
+    in_sz = getattr(slave, "Ibytes", None)
+    if out_sz is None:
+        out_sz = len(slave.output or b"")
+    if in_sz is None:
+        in_sz = len(slave.input or b"")
+    return out_sz, in_sz
+
+
 def _on_slave_emergency(_emcy):
     """CoE emergency handler so SDO traffic uses pysoem's callback path (not deprecated)."""
     pass
@@ -120,9 +341,19 @@ class EtherCATBus:
         pdo_config_path: Optional path to an ``ethercat_config.json`` file.
             When provided, per-slave PDO assignments are read from
             this file instead of using the hardcoded defaults.
+        realtime: Linux only.  Run the ProcessData thread (and, one step
+            lower, the PDO Update thread) under ``SCHED_FIFO`` and lock
+            process memory with ``mlockall`` on :meth:`open`.  Requires
+            root or ``CAP_SYS_NICE`` / ``CAP_IPC_LOCK``; falls back to
+            normal scheduling with a log message otherwise.  Best results
+            on a PREEMPT_RT kernel with the CPU isolated (``isolcpus=``).
+        rt_cpu: CPU to pin the ProcessData thread to when *realtime* is set
+            (``None`` leaves the affinity unchanged).
+        rt_priority: ``SCHED_FIFO`` priority of the ProcessData thread.
     """
 
-    def __init__(self, adapter=None, cycle_time_ms=10, pdo_config_path=None):
+    def __init__(self, adapter=None, cycle_time_ms=10, pdo_config_path=None,
+                 realtime=False, rt_cpu=None, rt_priority=80):
         if pdo_config_path:
             self.pdo_config = load_pdo_config(pdo_config_path)
             net = self._read_network_config(pdo_config_path)
@@ -135,9 +366,14 @@ class EtherCATBus:
 
         self.adapter = adapter
         self.cycle_time = cycle_time_ms / 1000.0
+        self.realtime = realtime
+        self.rt_cpu = rt_cpu
+        self.rt_priority = rt_priority
 
         self.master = None
-        self._slaves = []
+        self._slaves = {}
+        self._pdo_calls = ()
+        self._pdo_errors = {}
         self._lock = threading.Lock()
 
         self._pd_thread = None
@@ -146,13 +382,21 @@ class EtherCATBus:
         self._pd_stop = None
         self._pdo_stop = None
         self._check_stop = None
+        self._log_thread = None
+        self._log_q = queue.Queue(maxsize=256)
 
         self._comm_ok_count = 0
         self._comm_error_count = 0
         self._actual_wkc = 0
+        self._bad_wkc_streak = 0
+        self._io_sizes = []
 
         self.auto_reconnect = True
         self._reconnecting = threading.Event()
+        # Inverse of _reconnecting, so the cyclic threads can block until a
+        # reconnect finishes instead of polling.
+        self._reconnect_done = threading.Event()
+        self._reconnect_done.set()
 
     # ------------------------------------------------------------------
     # Context manager
@@ -177,7 +421,7 @@ class EtherCATBus:
     def _read_network_config(pdo_config_path):
         """Read the 'network' section from an ethercat_config.json file."""
         try:
-            raw = json.loads(Path(pdo_config_path).read_text(encoding="utf-8"))
+            raw = read_config_file(pdo_config_path)
             return raw.get("network", {})
         except Exception:
             return {}
@@ -186,39 +430,68 @@ class EtherCATBus:
     # Adapter discovery
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def list_adapters():
-        """Return available network adapters from PySOEM."""
-        return pysoem.find_adapters()
+    # Enumerating adapters goes through pcap (registry + driver queries with
+    # Npcap on Windows) and can take tens of ms; the result is reused for
+    # ADAPTER_CACHE_TTL seconds.
+    ADAPTER_CACHE_TTL = 2.0
+    _adapter_cache = (0.0, None)
+
+    @classmethod
+    def list_adapters(cls):
+        """Return available network adapters from PySOEM (as a tuple).
+
+        Results are cached for :attr:`ADAPTER_CACHE_TTL` seconds; call
+        :meth:`clear_adapter_cache` to force a fresh scan (e.g. after
+        plugging in a USB NIC).
+        """
+        now = time.monotonic()
+        stamp, adapters = cls._adapter_cache
+        if adapters is None or now - stamp >= cls.ADAPTER_CACHE_TTL:
+            adapters = tuple(pysoem.find_adapters())
+            EtherCATBus._adapter_cache = (now, adapters)
+        return adapters
 
     @staticmethod
-    def _resolve_adapter(adapter):
+    def clear_adapter_cache():
+        """Drop the cached :meth:`list_adapters` result."""
+        EtherCATBus._adapter_cache = (0.0, None)
+
+    @classmethod
+    def _resolve_adapter(cls, adapter):
         """Find a pysoem adapter object by name string.
 
-        Returns the adapter whose ``.name`` matches *adapter*.
+        Returns the adapter whose ``.name`` matches *adapter*.  A name missing
+        from the cached adapter list triggers one fresh scan before failing.
         Raises ``ConnectionError`` if not found.
         """
-        adapters = pysoem.find_adapters()
+        adapters = cls.list_adapters()
+        if adapter is not None and not any(
+            cls._adapter_name(a) == adapter for a in adapters
+        ):
+            cls.clear_adapter_cache()
+            adapters = cls.list_adapters()
         if not adapters:
             raise ConnectionError("No network adapters found")
         if adapter is None:
             return adapters[0]
         for a in adapters:
-            name = a.name.decode("utf-8", errors="replace") if isinstance(a.name, bytes) else str(a.name)
-            if name == adapter:
+            if cls._adapter_name(a) == adapter:
                 return a
-        available = ", ".join(
-            (a.name.decode("utf-8", errors="replace") if isinstance(a.name, bytes) else str(a.name))
-            for a in adapters
-        )
+        available = ", ".join(cls._adapter_name(a) for a in adapters)
         raise ConnectionError(f"Adapter '{adapter}' not found. Available: {available}")
 
+    @staticmethod
+    def _adapter_name(a):
+        """Adapter ``.name`` as ``str`` (PySOEM may return bytes)."""
+        return (a.name.decode("utf-8", errors="replace") if isinstance(a.name, bytes)
+                else str(a.name))
+
     # ------------------------------------------------------------------
     # Bus discovery
     # ------------------------------------------------------------------
 
     @classmethod
-    def discover(cls, adapter=None, pdo_config_path=None):
+    def discover(cls, adapter=None, pdo_config_path=None, esi_cache=False):
         """Scan the EtherCAT bus and return information about every slave.
 
         Opens the adapter, runs ``config_init`` + ``config_map`` to read
@@ -231,6 +504,12 @@ class EtherCATBus:
                 file.  Per-slave PDO assignments are applied before
                 ``config_map`` so that I/O sizes reflect the intended
                 mapping.
+            esi_cache: Reuse the available-PDO lists of previously seen
+                devices from the cache file (see :meth:`_esi_cache_path`)
+                instead of scanning 0x1600..0x1A0F over SDO again.  Entries
+                are keyed by vendor ID, product code and revision and are
+                only reused while the slave's PDO/startup config from
+                *pdo_config_path* is unchanged.  Off by default.
 
         Returns:
             list[dict]: One dict per slave with identity, I/O sizes,
@@ -279,171 +558,336 @@ class EtherCATBus:
 
             master.config_map()
 
-            slaves = []
-            for i, slave in enumerate(master.slaves):
-                info = {
-                    "index": i,
-                    "name": slave.name if isinstance(slave.name, str)
-                            else slave.name.decode("utf-8", errors="replace"),
-                    "vendor_id": f"0x{slave.man:08X}",
-                    "product_code": f"0x{slave.id:08X}",
-                    "revision": f"0x{slave.rev:08X}",
-                    "state": _state_name(slave.state),
-                    "output_bytes": len(bytes(slave.output)) if slave.output else 0,
-                    "input_bytes": len(bytes(slave.input)) if slave.input else 0,
-                }
-
-                cls._read_identity_strings(slave, info)
-                info["rx_pdo"] = cls._read_pdo_assignment(slave, 0x1C12, "RxPDO")
-                info["tx_pdo"] = cls._read_pdo_assignment(slave, 0x1C13, "TxPDO")
-                avail_rx, avail_tx = cls._discover_available_pdos(slave)
-                info["available_rx_pdo"] = avail_rx
-                info["available_tx_pdo"] = avail_tx
-
-                has_io = info["input_bytes"] > 0 or info["output_bytes"] > 0
-                no_coe = not avail_rx and not avail_tx
-                if has_io and no_coe:
-                    info["sii_only"] = True
-                    if info["output_bytes"] > 0 and not avail_rx:
-                        sii_rx = {
-                            "pdo_index": "SII",
-                            "label": f"Fixed EEPROM mapping ({info['output_bytes']} B outputs)",
-                            "readonly": True,
-                            "objects": [],
-                        }
-                        info["available_rx_pdo"] = [sii_rx]
-                    if info["input_bytes"] > 0 and not avail_tx:
-                        sii_tx = {
-                            "pdo_index": "SII",
-                            "label": f"Fixed EEPROM mapping ({info['input_bytes']} B inputs)",
-                            "readonly": True,
-                            "objects": [],
-                        }
-                        info["available_tx_pdo"] = [sii_tx]
-
-                slaves.append(info)
+            cache = config_tags = None
+            if esi_cache:
+                cache = cls._load_esi_cache()
+                loaded = dict(cache)
+                config_tags = [cls._slave_config_tag(pdo_config, i)
+                               for i in range(len(master.slaves))]
+            slaves = cls._probe_slaves(master.slaves, cache, config_tags)
         finally:
             master.close()
 
+        if cache is not None and cache != loaded:
+            cls._save_esi_cache(cache)
+
         return slaves
 
+    # ------------------------------------------------------------------
+    # Available-PDO cache
+    # ------------------------------------------------------------------
+
+    # Set to a path to override the default cache location.
+    ESI_CACHE_PATH = None
+
+    @classmethod
+    def _esi_cache_path(cls):
+        """Cache file: :attr:`ESI_CACHE_PATH`, else
+        ``$XDG_CACHE_HOME/ethercat_master/esi_cache.json`` (default
+        ``~/.cache``).  Resolved on use — there may be no home directory."""
+        if cls.ESI_CACHE_PATH is not None:
+            return Path(cls.ESI_CACHE_PATH)
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(base) / "ethercat_master" / "esi_cache.json"
+
+    @classmethod
+    def _load_esi_cache(cls):
+        """Load the available-PDO cache (empty dict if missing or unreadable)."""
+        try:
+            cache = read_config_file(cls._esi_cache_path())
+        except Exception:
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    @classmethod
+    def _save_esi_cache(cls, cache):
+        """Write the available-PDO cache; failures only cost the next scan."""
+        try:
+            path = cls._esi_cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(cache, indent=1) + "\n", encoding="utf-8")
+        except Exception as exc:
+            print(f"[BUS] Could not write the ESI cache: {exc}")
+
+    @staticmethod
+    def _esi_cache_key(slave):
+        return f"{slave.man:08X}:{slave.id:08X}:{slave.rev:08X}"
+
     @staticmethod
-    def _read_identity_strings(slave, info):
-        """Read CoE identity objects 0x1008 / 0x1009 / 0x100A via SDO."""
+    def _cached_pdos(entry, config_tag):
+        """Return ``(available_rx, available_tx)`` copies from a cache entry.
+
+        Returns None for an entry made under another *config_tag* or one
+        that is malformed (stale format, hand-edited), so it is rescanned.
+        """
+        if not isinstance(entry, dict) or entry.get("config") != config_tag:
+            return None
+        pdos = (entry.get("available_rx_pdo"), entry.get("available_tx_pdo"))
+        for lst in pdos:
+            if not isinstance(lst, list) or not all(isinstance(p, dict) for p in lst):
+                return None
+        return copy.deepcopy(pdos)
+
+    @staticmethod
+    def _slave_config_tag(pdo_config, slave_index):
+        """Digest of the PDO assignment and startup SDOs applied to a slave.
+
+        Startup SDOs (e.g. the modular 0xF030 slot config) can change which
+        PDOs a device exposes, so cached scans are tied to this tag.
+        """
+        applied = (get_slave_pdo(pdo_config, slave_index),
+                   get_slave_startup(pdo_config, slave_index))
+        return hashlib.sha1(repr(applied).encode()).hexdigest()
+
+    @classmethod
+    def _probe_slaves(cls, pysoem_slaves, esi_cache=None, config_tags=None):
+        """Probe all slaves and return their info dicts in bus order.
+
+        Slaves are probed one after another: SOEM keeps a single, unlocked
+        error list per master that PySOEM inspects after every SDO call, so
+        concurrent SDO reads (many of which abort by design while scanning
+        for PDOs) could turn one slave's abort into another's failure.
+        """
+        slaves = list(pysoem_slaves)
+        tags = config_tags or [None] * len(slaves)
+        return [cls._probe_slave(i, slave, tags[i], esi_cache=esi_cache)
+                for i, slave in enumerate(slaves)]
+
+    @classmethod
+    def _probe_slave(cls, i, slave, config_tag=None, esi_cache=None):
+        """Read identity, I/O sizes and PDO layout of one slave.
+
+        With an *esi_cache* dict, the available-PDO scan is taken from (or
+        added to) the cache entry for the slave's identity; an entry made
+        under a different *config_tag* is rescanned.  Empty scans are never
+        cached, since they are indistinguishable from failed SDO reads.
+        """
+        info = {
+            "index": i,
+            "name": slave.name if isinstance(slave.name, str)
+                    else slave.name.decode("utf-8", errors="replace"),
+            "vendor_id": f"0x{slave.man:08X}",
+            "product_code": f"0x{slave.id:08X}",
+            "revision": f"0x{slave.rev:08X}",
+            "state": _state_name(slave.state),
+        }
+        info["output_bytes"], info["input_bytes"] = _slave_io_sizes(slave)
+
+        cls._read_identity_strings(slave, info)
+        memo = {}
+        info["rx_pdo"] = cls._read_pdo_assignment(slave, 0x1C12, "RxPDO", memo)
+        info["tx_pdo"] = cls._read_pdo_assignment(slave, 0x1C13, "TxPDO", memo)
+        cached = None
+        if esi_cache is not None:
+            key = cls._esi_cache_key(slave)
+            cached = cls._cached_pdos(esi_cache.get(key), config_tag)
+        if cached is not None:
+            avail_rx, avail_tx = cached
+        else:
+            avail_rx, avail_tx = cls._discover_available_pdos(slave, memo)
+            if esi_cache is not None and (avail_rx or avail_tx):
+                esi_cache[key] = {
+                    "config": config_tag,
+                    "available_rx_pdo": copy.deepcopy(avail_rx),
+                    "available_tx_pdo": copy.deepcopy(avail_tx),
+                }
+        info["available_rx_pdo"] = avail_rx
+        info["available_tx_pdo"] = avail_tx
+
+        has_io = info["input_bytes"] > 0 or info["output_bytes"] > 0
+        no_coe = not avail_rx and not avail_tx
+        if has_io and no_coe:
+            info["sii_only"] = True
+            if info["output_bytes"] > 0 and not avail_rx:
+                sii_rx = {
+                    "pdo_index": "SII",
+                    "label": f"Fixed EEPROM mapping ({info['output_bytes']} B outputs)",
+                    "readonly": True,
+                    "objects": [],
+                }
+                info["available_rx_pdo"] = [sii_rx]
+            if info["input_bytes"] > 0 and not avail_tx:
+                sii_tx = {
+                    "pdo_index": "SII",
+                    "label": f"Fixed EEPROM mapping ({info['input_bytes']} B inputs)",
+                    "readonly": True,
+                    "objects": [],
+                }
+                info["available_tx_pdo"] = [sii_tx]
+
+        return info
+
+    # Vendor ID -> SDO read size that last returned identity strings.
+    _identity_size_hint = {}
+
+    @classmethod
+    def _read_identity_strings(cls, slave, info):
+        """Read CoE identity objects 0x1008 / 0x1009 / 0x100A via SDO.
+
+        The largest buffer (64 bytes) is tried first and the first
+        non-empty answer wins; smaller sizes and the default-size read are
+        only fallbacks for slaves that reject it.  The size that worked is
+        remembered per vendor and tried first for the next slave.
+        """
+        vendor = getattr(slave, "man", None)
+        hint = cls._identity_size_hint.get(vendor, 64)
+        sizes = (hint,) + tuple(sz for sz in (64, 32, 16, None) if sz != hint)
         for key, idx in [
             ("device_name", 0x1008),
             ("hw_version", 0x1009),
             ("fw_version", 0x100A),
         ]:
             info[key] = ""
-            for sz in (64, 32, 16, None):
+            for sz in sizes:
                 try:
                     raw = (slave.sdo_read(idx, 0) if sz is None
                            else slave.sdo_read(idx, 0, sz))
-                    if raw:
-                        s = raw.decode("utf-8", errors="replace").rstrip("\x00").strip()
-                        if len(s) > len(info[key]):
-                            info[key] = s
                 except Exception:
                     continue
+                s = raw.decode("utf-8", errors="replace").rstrip("\x00").strip() if raw else ""
+                if s:
+                    info[key] = s
+                    cls._identity_size_hint[vendor] = sz
+                    break
 
     @classmethod
-    def _read_pdo_assignment(cls, slave, sm_index, label):
+    def _read_pdo_assignment(cls, slave, sm_index, label, memo=None):
         """Read PDO assignment list from SM2 (0x1C12) or SM3 (0x1C13).
 
+        *memo* is an optional per-slave ``{pdo_index: objects}`` cache shared
+        with :meth:`_discover_available_pdos` so each mapping is read once.
+
         Returns a list of dicts with ``pdo_index`` and ``objects``.
         """
         result = []
-        try:
-            raw = slave.sdo_read(sm_index, 0)
-            n_pdos = raw[0] if raw else 0
-        except Exception:
-            return result
-
-        for sub in range(1, n_pdos + 1):
+        pdo_indices = cls._read_array_ca(slave, sm_index, _U16)
+        if pdo_indices is None:
+            pdo_indices = []
             try:
-                raw = slave.sdo_read(sm_index, sub, 2)
-                pdo_idx = struct.unpack("<H", raw[:2])[0]
+                raw = slave.sdo_read(sm_index, 0)
+                n_pdos = raw[0] if raw else 0
             except Exception:
-                continue
+                return result
+
+            for sub in range(1, n_pdos + 1):
+                try:
+                    raw = slave.sdo_read(sm_index, sub, 2)
+                except Exception:
+                    continue
+                if len(raw) < 2:
+                    continue
+                pdo_indices.append(int.from_bytes(raw[:2], "little"))
 
+        for pdo_idx in pdo_indices:
             if pdo_idx and not pdo_mapping_exists(slave, pdo_idx):
                 continue
 
-            pdo_entry = {"pdo_index": f"0x{pdo_idx:04X}", "objects": []}
-            pdo_entry["objects"] = cls._read_pdo_mapping(slave, pdo_idx)
+            pdo_entry = {"pdo_index": _hex16(pdo_idx), "objects": []}
+            pdo_entry["objects"] = cls._read_pdo_mapping_cached(slave, pdo_idx, memo)
             result.append(pdo_entry)
 
         return result
 
+    @classmethod
+    def _read_pdo_mapping_cached(cls, slave, pdo_index, memo, n_entries=None):
+        """:meth:`_read_pdo_mapping` memoized in *memo* (if given)."""
+        if memo is None:
+            return cls._read_pdo_mapping(slave, pdo_index, n_entries)
+        objects = memo.get(pdo_index)
+        if objects is None:
+            objects = memo[pdo_index] = cls._read_pdo_mapping(slave, pdo_index, n_entries)
+        return objects
+
     @staticmethod
-    def _read_pdo_mapping(slave, pdo_index):
+    def _read_array_ca(slave, index, item):
+        """Read an array object (count + entries) with one complete-access SDO.
+
+        The CA upload of subindex 0 returns the count padded to 16 bits,
+        followed by the entries packed with *item* (a ``struct.Struct``).
+
+        Returns:
+            list[int] | None: The entries, or ``None`` if the slave rejected
+            the complete-access read or returned a short buffer.
+        """
+        try:
+            raw = bytes(slave.sdo_read(index, 0, 0, True))
+        except Exception:
+            return None
+        if len(raw) < 2:
+            return None
+        end = 2 + raw[0] * item.size
+        if len(raw) < end:
+            return None
+        return [v for (v,) in item.iter_unpack(raw[2:end])]
+
+    @classmethod
+    def _read_pdo_mapping(cls, slave, pdo_index, n_entries=None):
         """Read the mapping entries for a single PDO index.
 
         Each mapping entry is a 32-bit value:
           bits 31..16 = object index
           bits 15..8  = subindex
           bits  7..0  = bit length
+
+        The whole object is read with one complete-access SDO where the
+        slave supports it; otherwise each subindex is read on its own.
+        Pass *n_entries* when subindex 0 has already been read.
         """
-        objects = []
-        try:
-            raw = slave.sdo_read(pdo_index, 0)
-            n_entries = raw[0] if raw else 0
-        except Exception:
-            return objects
+        entries = cls._read_array_ca(slave, pdo_index, _U32)
+        if entries is None:
+            entries = []
+            if n_entries is None:
+                try:
+                    raw = slave.sdo_read(pdo_index, 0)
+                    n_entries = raw[0] if raw else 0
+                except Exception:
+                    return []
 
-        for sub in range(1, n_entries + 1):
-            try:
-                raw = slave.sdo_read(pdo_index, sub, 4)
-                mapping = struct.unpack("<I", raw[:4])[0]
-                obj_index = (mapping >> 16) & 0xFFFF
-                obj_sub = (mapping >> 8) & 0xFF
-                bit_len = mapping & 0xFF
-                objects.append({
-                    "index": f"0x{obj_index:04X}",
-                    "subindex": obj_sub,
-                    "bits": bit_len,
-                })
-            except Exception:
-                continue
-        return objects
+            for sub in range(1, n_entries + 1):
+                try:
+                    raw = slave.sdo_read(pdo_index, sub, 4)
+                except Exception:
+                    continue
+                if len(raw) >= 4:
+                    entries.append(int.from_bytes(raw[:4], "little"))
+
+        return [
+            {
+                "index": _hex16((mapping >> 16) & 0xFFFF),
+                "subindex": (mapping >> 8) & 0xFF,
+                "bits": mapping & 0xFF,
+            }
+            for mapping in entries
+        ]
 
     @classmethod
-    def _discover_available_pdos(cls, slave):
+    def _discover_available_pdos(cls, slave, memo=None):
         """Probe a slave for all available RxPDO and TxPDO indices.
 
-        Scans 0x1600..0x160F (RxPDO) and 0x1A00..0x1A0F (TxPDO).
+        Scans 0x1600..0x160F (RxPDO) and 0x1A00..0x1A0F (TxPDO).  PDOs
+        already in *memo* (e.g. read as part of the SM assignment) are
+        reused without further SDO traffic.
 
         Returns:
             tuple[list, list]: (available_rx_pdo, available_tx_pdo).
         """
-        rx = []
-        for idx in range(0x1600, 0x1610):
-            try:
-                raw = slave.sdo_read(idx, 0)
-                n = raw[0] if raw else 0
-                if n > 0:
-                    rx.append({
-                        "pdo_index": f"0x{idx:04X}",
-                        "objects": cls._read_pdo_mapping(slave, idx),
-                    })
-            except Exception:
-                continue
-
-        tx = []
-        for idx in range(0x1A00, 0x1A10):
-            try:
-                raw = slave.sdo_read(idx, 0)
-                n = raw[0] if raw else 0
-                if n > 0:
-                    tx.append({
-                        "pdo_index": f"0x{idx:04X}",
-                        "objects": cls._read_pdo_mapping(slave, idx),
-                    })
-            except Exception:
-                continue
+        def _scan(indices):
+            found = []
+            for idx in indices:
+                objects = memo.get(idx) if memo is not None else None
+                if not objects:
+                    try:
+                        raw = slave.sdo_read(idx, 0)
+                        n = raw[0] if raw else 0
+                    except Exception:
+                        continue
+                    if n <= 0:
+                        continue
+                    objects = cls._read_pdo_mapping_cached(slave, idx, memo, n)
+                found.append({"pdo_index": _hex16(idx), "objects": objects})
+            return found
 
-        return rx, tx
+        return _scan(range(0x1600, 0x1610)), _scan(range(0x1A00, 0x1A10))
 
     # ------------------------------------------------------------------
     # Slave registration
@@ -460,14 +904,42 @@ class EtherCATBus:
         - ``seed_tx(pysoem_slave)`` — initial TX buffer
         - ``safe_stop()`` — graceful shutdown
         - ``on_reconnect(master)`` — post-reconnect hook
+
+        ``pdo_update`` runs every cycle, so handles should keep the pysoem
+        slave passed to ``configure()`` (and re-fetch it once in
+        ``on_reconnect()``) rather than indexing ``master.slaves`` per call.
+        """
+        self.register_slaves((slave_handle,))
+
+    def register_slaves(self, slave_handles):
+        """Register several slave handles at once.
+
+        Same as calling :meth:`register_slave` for each handle, but the
+        lock is taken and the PDO call table rebuilt only once.
         """
         with self._lock:
-            self._slaves.append(slave_handle)
+            for handle in slave_handles:
+                self._slaves[id(handle)] = handle
+            self._publish_slaves()
 
     def unregister_slave(self, slave_handle):
         """Remove a slave handle from the PDO cycle."""
         with self._lock:
-            self._slaves = [s for s in self._slaves if s is not slave_handle]
+            self._slaves.pop(id(slave_handle), None)
+            self._publish_slaves()
+
+    def _publish_slaves(self):
+        """Publish an immutable tuple of ``(slave_index, pdo_update)`` pairs.
+
+        Must be called with ``self._lock`` held.  The PDO Update loop reads
+        ``self._pdo_calls`` without locking; rebinding the attribute is
+        atomic, so it always sees either the old or the new tuple.  The
+        bound methods are looked up here once instead of on every cycle.
+        """
+        self._pdo_calls = tuple(
+            (handle.slave_index, handle.pdo_update)
+            for handle in self._slaves.values()
+        )
 
     # ------------------------------------------------------------------
     # Open / Close
@@ -487,9 +959,13 @@ class EtherCATBus:
                 "Please run with sudo: sudo python your_script.py"
             )
 
+        if self.realtime and _lock_memory():
+            print("[BUS] Process memory locked (mlockall)")
+
         adapter = self._resolve_adapter(self.adapter)
         print(f"[BUS] Connecting to: {adapter.name}")
 
+        self._pdo_errors.clear()
         self.master = pysoem.Master()
         self.master.open(adapter.name)
         self.master.in_op = False
@@ -509,14 +985,14 @@ class EtherCATBus:
         self._apply_startup_sdos("IP")
 
         with self._lock:
-            for handle in self._slaves:
+            for handle in self._slaves.values():
                 try:
                     rx, tx = get_slave_pdo(self.pdo_config, handle.slave_index)
                     pysoem_slave = self.master.slaves[handle.slave_index]
                     handle.configure(pysoem_slave, rx_pdo=rx, tx_pdo=tx)
                     print(f"[BUS] Slave {handle.slave_index}: "
-                          f"configured RxPDO={[f'0x{p:04X}' for p in (rx or [])]} "
-                          f"TxPDO={[f'0x{p:04X}' for p in (tx or [])]}")
+                          f"configured RxPDO={[_hex16(p) for p in (rx or [])]} "
+                          f"TxPDO={[_hex16(p) for p in (tx or [])]}")
                 except Exception as exc:
                     raise ConfigurationError(
                         f"PDO mapping failed for slave {handle.slave_index}: {exc}"
@@ -524,7 +1000,7 @@ class EtherCATBus:
 
         # Slaves with no registered handle (e.g. web UI omits 0‑byte devices after
         # discover) still need CoE PDO mapping from get_slave_pdo / ethercat_config.
-        registered = {h.slave_index for h in self._slaves}
+        registered = {h.slave_index for h in self._slaves.values()}
         for idx, slave in enumerate(self.master.slaves):
             if idx in registered:
                 continue
@@ -538,8 +1014,8 @@ class EtherCATBus:
                 configure_pdo_mapping(slave, rx_pdo=rx, tx_pdo=tx)
                 print(
                     f"[BUS] Slave {idx}: "
-                    f"configured RxPDO={[f'0x{p:04X}' for p in (rx or [])]} "
-                    f"TxPDO={[f'0x{p:04X}' for p in (tx or [])]} "
+                    f"configured RxPDO={[_hex16(p) for p in (rx or [])]} "
+                    f"TxPDO={[_hex16(p) for p in (tx or [])]} "
                     f"(pdo_config, no handle)"
                 )
             except Exception as exc:
@@ -559,6 +1035,7 @@ class EtherCATBus:
         # the PDO assignment and before config_map() so process data is sized.
         self._apply_startup_sdos("PS")
 
+        self._io_sizes = []
         try:
             self.master.config_map()
         except Exception as exc:
@@ -567,10 +1044,11 @@ class EtherCATBus:
                 f"config_map() failed: {exc}. {details}"
             ) from exc
 
+        self._io_sizes = [_slave_io_sizes(slave) for slave in self.master.slaves]
+
         print("[BUS] I/O map after config_map():")
         for i, slave in enumerate(self.master.slaves):
-            out_sz = len(bytes(slave.output)) if slave.output else 0
-            in_sz = len(bytes(slave.input)) if slave.input else 0
+            out_sz, in_sz = self._io_sizes[i]
             name = slave.name if isinstance(slave.name, str) else slave.name.decode("utf-8", errors="replace")
             print(f"  [{i}] {name}: Out={out_sz}B, In={in_sz}B")
 
@@ -582,7 +1060,7 @@ class EtherCATBus:
         print("[BUS] Reached SAFE-OP state")
 
         with self._lock:
-            for handle in self._slaves:
+            for handle in self._slaves.values():
                 handle.seed_tx(self.master.slaves[handle.slave_index])
 
         self._start_threads()
@@ -601,62 +1079,6 @@ class EtherCATBus:
         self.master.in_op = True
         print("[BUS] Reached OP state — bus ready")
 
-    _AL_STATUS_CODES = {
-        0x0000: "No error",
-        0x0001: "Unspecified error",
-        0x0003: "Invalid device setup (modular: 0xF030 != detected 0xF050)",
-        0x0011: "Invalid requested state change",
-        0x0012: "Unknown requested state",
-        0x0013: "Bootstrap not supported",
-        0x0014: "No valid firmware",
-        0x0015: "Invalid mailbox configuration (BOOT)",
-        0x0016: "Invalid mailbox configuration (PREOP)",
-        0x0017: "Invalid sync manager configuration",
-        0x0018: "No valid inputs available",
-        0x0019: "No valid outputs",
-        0x001A: "Synchronization error",
-        0x001B: "Sync manager watchdog",
-        0x001C: "Invalid sync manager types",
-        0x001D: "Invalid output configuration",
-        0x001E: "Invalid input configuration",
-        0x001F: "Invalid watchdog configuration",
-        0x0020: "Slave needs cold start",
-        0x0021: "Slave needs INIT",
-        0x0022: "Slave needs PREOP",
-        0x0023: "Slave needs SAFEOP",
-        0x0024: "Invalid input mapping",
-        0x0025: "Invalid output mapping",
-        0x0026: "Inconsistent settings",
-        0x0027: "FreeRun not supported",
-        0x0028: "SyncMode not supported",
-        0x0029: "FreeRun needs 3-buffer mode",
-        0x002A: "Background watchdog",
-        0x002B: "No valid inputs and outputs",
-        0x002C: "Fatal sync error",
-        0x002D: "No sync error",
-        0x002E: "Invalid input FMMU configuration",
-        0x0030: "Invalid DC sync configuration",
-        0x0031: "Invalid DC latch configuration",
-        0x0032: "PLL error",
-        0x0033: "DC sync I/O error",
-        0x0034: "DC sync timeout",
-        0x0035: "DC invalid sync cycle time",
-        0x0036: "DC sync0 cycle time",
-        0x0037: "DC sync1 cycle time",
-        0x0041: "MBX_AOE",
-        0x0042: "MBX_EOE",
-        0x0043: "MBX_COE",
-        0x0044: "MBX_FOE",
-        0x0045: "MBX_SOE",
-        0x004F: "MBX_VOE",
-        0x0050: "EEPROM no access",
-        0x0051: "EEPROM error",
-        0x0060: "Slave restarted locally",
-        0x0061: "Device identification value updated",
-        0x0070: "Invalid module configuration (0xF030 != 0xF050)",
-        0x00F0: "Application controller available",
-    }
-
     def _apply_startup_sdos(self, transition):
         """Apply configured CoE startup SDO writes for the given transition.
 
@@ -701,6 +1123,12 @@ class EtherCATBus:
         except Exception:
             pass
 
+        # Sizes are cached after config_map(); before that (e.g. config_map
+        # itself failed) measure the slaves directly.
+        io_sizes = self._io_sizes
+        if len(io_sizes) != len(self.master.slaves):
+            io_sizes = [_slave_io_sizes(slave) for slave in self.master.slaves]
+
         lines = []
         for i, slave in enumerate(self.master.slaves):
             state = _state_name(slave.state)
@@ -711,16 +1139,23 @@ class EtherCATBus:
             al_status = getattr(slave, "al_status", None)
             if not al_status:
                 al_status = self._read_al_status_code(slave)
-            al_hex = f"0x{al_status:04X}" if al_status else "N/A"
-            al_text = self._AL_STATUS_CODES.get(al_status, "Unknown") if al_status else ""
+            if not al_status:
+                al_hex = "N/A"
+            elif al_status < len(_AL_HEX):
+                al_hex = _AL_HEX[al_status]
+            else:
+                al_hex = f"0x{al_status:04X}"
+            al_text = (_al_status_text(al_status) or "Unknown") if al_status else ""
 
-            out_sz = len(bytes(slave.output)) if slave.output else 0
-            in_sz = len(bytes(slave.input)) if slave.input else 0
+            out_sz, in_sz = io_sizes[i]
 
             line = f"  [{i}] {name}: state={state}, AL={al_hex}"
             if al_text:
                 line += f" ({al_text})"
             line += f", Out={out_sz}B, In={in_sz}B"
+            pdo_errors = self._pdo_errors.get(i)
+            if pdo_errors:
+                line += f", pdo_update errors={pdo_errors}"
             lines.append(line)
 
         if lines:
@@ -730,7 +1165,7 @@ class EtherCATBus:
     def close(self):
         """Stop all slaves and close the EtherCAT connection."""
         with self._lock:
-            for handle in self._slaves:
+            for handle in self._slaves.values():
                 try:
                     handle.safe_stop()
                 except Exception:
@@ -750,11 +1185,22 @@ class EtherCATBus:
     def connected(self):
         return self.master is not None and self.master.in_op
 
+    @property
+    def pdo_errors(self):
+        """Count of exceptions raised by ``pdo_update`` since :meth:`open`,
+        keyed by slave index."""
+        return dict(self._pdo_errors)
+
     # ------------------------------------------------------------------
     # Internal: threads
     # ------------------------------------------------------------------
 
     def _start_threads(self):
+        self._log_thread = threading.Thread(
+            target=self._log_loop, name="EtherCAT-Log", daemon=True
+        )
+        self._log_thread.start()
+
         self._pd_stop = threading.Event()
         self._pd_thread = threading.Thread(
             target=self._processdata_loop, name="EtherCAT-ProcessData", daemon=False
@@ -786,67 +1232,158 @@ class EtherCATBus:
         self._pd_thread = None
         self._pdo_thread = None
         self._check_thread = None
+        if self._log_thread:
+            # Same non-blocking put as _log(): a stalled log thread with a
+            # full queue must not hang close().
+            self._log(None)
+            self._log_thread.join(timeout=2.0)
+            self._log_thread = None
+
+    def _log(self, msg):
+        """Queue a log line for the log thread; never blocks the caller.
+
+        Bus threads must not stall on a slow stdout (pipe, terminal), so
+        when the queue is full the oldest pending line is dropped.
+        """
+        try:
+            self._log_q.put_nowait(msg)
+        except queue.Full:
+            try:
+                self._log_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._log_q.put_nowait(msg)
+            except queue.Full:
+                pass
+
+    def _log_loop(self):
+        """Print queued log lines until the ``None`` sentinel arrives."""
+        for msg in iter(self._log_q.get, None):
+            print(msg)
 
     def _processdata_loop(self):
-        """Fast send/receive — 1 ms cycle. No locks, no processing."""
-        while not self._pd_stop.is_set():
-            if self._reconnecting.is_set():
-                time.sleep(0.05)
+        """Fast send/receive — 1 ms cycle. No locks, no processing.
+
+        PySOEM runs ``send_processdata`` / ``receive_processdata`` with the
+        GIL released, and :func:`_sleep_until` releases it inside the ctypes
+        call, so the PDO Update thread can run during all three blocking
+        steps; the GIL is only held for the few bytecodes in between.
+        """
+        if self.realtime:
+            _set_thread_realtime(self.rt_priority, self.rt_cpu, log=self._log)
+        period_ns = 1_000_000
+        deadline = time.monotonic_ns()
+        stop_is_set = self._pd_stop.is_set
+        reconnecting_is_set = self._reconnecting.is_set
+        wait_reconnected = self._reconnect_done.wait
+        next_deadline = _next_deadline
+        sleep_until = _sleep_until
+
+        # Bound methods of the current master; refreshed when a reconnect
+        # replaces self.master.
+        master = send = receive = None
+        expected_wkc = 0
+        bad_streak = 0
+
+        while not stop_is_set():
+            if reconnecting_is_set():
+                wait_reconnected(0.1)
                 continue
             try:
-                self.master.send_processdata()
-                self._actual_wkc = self.master.receive_processdata(10000)
-                if self._actual_wkc != self.master.expected_wkc:
+                if self.master is not master:
+                    master = self.master
+                    send = master.send_processdata
+                    receive = master.receive_processdata
+                    expected_wkc = master.expected_wkc
+                send()
+                wkc = self._actual_wkc = receive(10000)
+                if wkc != expected_wkc:
                     self._comm_error_count += 1
-                    if self.master.in_op:
-                        self.master.do_check_state = True
+                    bad_streak += 1
+                    # A single short frame is usually scheduling jitter; only
+                    # ask the check thread for a state poll once it persists.
+                    if bad_streak >= _WKC_DEBOUNCE and master.in_op:
+                        master.do_check_state = True
                 else:
                     self._comm_ok_count += 1
+                    bad_streak = 0
             except Exception:
                 self._comm_error_count += 1
-            time.sleep(0.001)
+            deadline = next_deadline(deadline, period_ns)
+            sleep_until(deadline)
 
     def _pdo_update_loop(self):
         """Iterate over all registered slaves: decode RX, encode TX."""
-        while not self._pdo_stop.is_set():
-            if self._reconnecting.is_set():
-                time.sleep(0.05)
+        if self.realtime:
+            _set_thread_realtime(max(self.rt_priority - 1, 1), log=self._log)
+        period_ns = int(self.cycle_time * 1e9)
+        deadline = time.monotonic_ns()
+        reconnecting = self._reconnecting
+        stop_is_set = self._pdo_stop.is_set
+        reconnecting_is_set = reconnecting.is_set
+        wait_reconnected = self._reconnect_done.wait
+        next_deadline = _next_deadline
+        sleep_until = _sleep_until
+        errors = self._pdo_errors
+
+        while not stop_is_set():
+            if reconnecting_is_set():
+                wait_reconnected(0.1)
                 continue
-            with self._lock:
-                for handle in self._slaves:
-                    try:
-                        handle.pdo_update(self.master, self._reconnecting)
-                    except Exception:
-                        pass
-            time.sleep(self.cycle_time)
+            master = self.master
+            for slave_index, pdo_update in self._pdo_calls:
+                try:
+                    pdo_update(master, reconnecting)
+                except Exception:
+                    # Count rather than raise: one failing handle must not
+                    # stop the cycle for the others.
+                    errors[slave_index] = errors.get(slave_index, 0) + 1
+            deadline = next_deadline(deadline, period_ns)
+            sleep_until(deadline)
 
     def _check_loop(self):
         """Monitor slave health and attempt recovery — 300 ms cycle."""
         _consecutive_lost = 0
         _RECONNECT_THRESHOLD = 7
-
-        while not self._check_stop.is_set():
-            if self._reconnecting.is_set():
+        OP_STATE = pysoem.OP_STATE
+        stop_is_set = self._check_stop.is_set
+        reconnecting_is_set = self._reconnecting.is_set
+        sleep = time.sleep
+        recover_slave = self._recover_slave
+        log = self._log
+
+        while not stop_is_set():
+            if reconnecting_is_set():
                 _consecutive_lost = 0
-                time.sleep(0.1)
+                sleep(0.1)
                 continue
 
             try:
-                if self.master and self.master.in_op and (
-                    (self._actual_wkc < self.master.expected_wkc)
-                    or self.master.do_check_state
+                master = self.master
+                if master and master.in_op and self._actual_wkc < master.expected_wkc:
+                    self._bad_wkc_streak += 1
+                else:
+                    self._bad_wkc_streak = 0
+
+                # read_state() polls every slave; skip it for isolated WKC
+                # dips.  do_check_state (persistent mismatch or a slave still
+                # recovering) bypasses the debounce.
+                if master and master.in_op and (
+                    self._bad_wkc_streak >= _WKC_DEBOUNCE
+                    or master.do_check_state
                 ):
-                    self.master.do_check_state = False
-                    self.master.read_state()
+                    master.do_check_state = False
+                    master.read_state()
 
                     all_ok = True
-                    for i, slave in enumerate(self.master.slaves):
-                        if slave.state != pysoem.OP_STATE:
+                    for i, slave in enumerate(master.slaves):
+                        if slave.state != OP_STATE:
                             all_ok = False
-                            self.master.do_check_state = True
-                            self._recover_slave(slave, i)
+                            master.do_check_state = True
+                            recover_slave(slave, i)
 
-                    if not self.master.do_check_state:
+                    if not master.do_check_state:
                         _consecutive_lost = 0
                     elif not all_ok:
                         _consecutive_lost += 1
@@ -858,14 +1395,14 @@ class EtherCATBus:
             if (
                 _consecutive_lost >= _RECONNECT_THRESHOLD
                 and self.auto_reconnect
-                and not self._reconnecting.is_set()
+                and not reconnecting_is_set()
             ):
-                print(f"[BUS] Lost contact for "
-                      f"{_consecutive_lost * 0.3:.1f}s — triggering reconnect")
+                log(f"[BUS] Lost contact for "
+                    f"{_consecutive_lost * 0.3:.1f}s — triggering reconnect")
                 _consecutive_lost = 0
                 self._attempt_reconnect()
 
-            time.sleep(0.3)
+            sleep(0.3)
 
     # ------------------------------------------------------------------
     # Reconnect
@@ -873,9 +1410,10 @@ class EtherCATBus:
 
     def _attempt_reconnect(self):
         """Tear down the master and rebuild from scratch."""
+        self._reconnect_done.clear()
         self._reconnecting.set()
         self.master.in_op = False
-        print("[BUS] Connection lost — attempting reconnect ...")
+        self._log("[BUS] Connection lost — attempting reconnect ...")
         time.sleep(0.1)
 
         try:
@@ -903,12 +1441,12 @@ class EtherCATBus:
                 self._apply_startup_sdos("IP")
 
                 with self._lock:
-                    for handle in self._slaves:
+                    for handle in self._slaves.values():
                         rx, tx = get_slave_pdo(self.pdo_config, handle.slave_index)
                         handle.configure(self.master.slaves[handle.slave_index],
                                          rx_pdo=rx, tx_pdo=tx)
 
-                registered = {h.slave_index for h in self._slaves}
+                registered = {h.slave_index for h in self._slaves.values()}
                 for idx, slave in enumerate(self.master.slaves):
                     if idx in registered:
                         continue
@@ -936,6 +1474,7 @@ class EtherCATBus:
                 self._apply_startup_sdos("PS")
 
                 self.master.config_map()
+                self._io_sizes = [_slave_io_sizes(slave) for slave in self.master.slaves]
 
                 if self.master.state_check(
                     pysoem.SAFEOP_STATE, 50000
@@ -943,15 +1482,18 @@ class EtherCATBus:
                     raise CommunicationError("Failed to reach SAFE-OP")
 
                 with self._lock:
-                    for handle in self._slaves:
+                    for handle in self._slaves.values():
                         handle.seed_tx(self.master.slaves[handle.slave_index])
 
                 self.master.state = pysoem.OP_STATE
                 self.master.write_state()
 
-                deadline = time.time() + 5.0
+                # The ProcessData thread is parked while reconnecting, so
+                # this loop must keep frames flowing for the slaves to
+                # accept OP (SM watchdog); state_check alone would starve them.
+                deadline = time.monotonic() + 5.0
                 reached_op = False
-                while time.time() < deadline:
+                while time.monotonic() < deadline:
                     self.master.send_processdata()
                     self.master.receive_processdata(10000)
                     if self.master.state_check(
@@ -968,15 +1510,16 @@ class EtherCATBus:
                 self._comm_error_count = 0
 
                 with self._lock:
-                    for handle in self._slaves:
+                    for handle in self._slaves.values():
                         handle.on_reconnect(self.master)
 
                 self._reconnecting.clear()
-                print("[BUS] Successfully reconnected")
+                self._reconnect_done.set()
+                self._log("[BUS] Successfully reconnected")
                 return
 
             except Exception as exc:
-                print(f"[BUS] Reconnect attempt failed: {exc} — retrying in {backoff:.0f}s")
+                self._log(f"[BUS] Reconnect attempt failed: {exc} — retrying in {backoff:.0f}s")
                 try:
                     self.master.close()
                 except Exception:
@@ -985,8 +1528,7 @@ class EtherCATBus:
                 self._check_stop.wait(backoff)
                 backoff = min(backoff * 2, 10.0)
 
-    @staticmethod
-    def _recover_slave(slave, pos):
+    def _recover_slave(self, slave, pos):
         """Attempt to recover a slave that left OP state."""
         if slave.state == (pysoem.SAFEOP_STATE + pysoem.STATE_ERROR):
             slave.state = pysoem.SAFEOP_STATE + pysoem.STATE_ACK
@@ -1001,12 +1543,12 @@ class EtherCATBus:
             slave.state_check(pysoem.OP_STATE)
             if slave.state == pysoem.NONE_STATE:
                 slave.is_lost = True
-                print(f"[BUS] ERROR: Slave {pos} lost!")
+                self._log(f"[BUS] ERROR: Slave {pos} lost!")
 
         if slave.is_lost:
             if slave.state == pysoem.NONE_STATE:
                 if slave.recover():
                     slave.is_lost = False
-                    print(f"[BUS] Slave {pos} recovered")
+                    self._log(f"[BUS] Slave {pos} recovered")
             else:
                 slave.is_lost = False
@@ -27,6 +27,7 @@ Or programmatically via an open ``EtherCATBus``::
     bus.close()
 """
 
+import math
 import time
 
 try:
@@ -38,7 +39,17 @@ except ImportError:
 class NetworkLatencyTest:
     """Measure EtherCAT SDO round-trip latency for any slave."""
 
+    # Timed reads per run.  Keep this at 50 or more — p95/p99 come from
+    # single ranked samples and are meaningless for small counts.
     NUM_SAMPLES = 200
+    # Untimed reads before sampling, so first-touch mailbox setup does not
+    # land in max/p99.
+    WARMUP_READS = 3
+    # Idle gap between consecutive reads (0 = back-to-back).  Some slaves
+    # abort SDOs when their mailbox is hammered without a pause.
+    MIN_INTERVAL_US = 0
+    # Extra attempts (with 1, 2, 4 ms backoff) before a read counts as failed.
+    SDO_RETRIES = 3
     SDO_INDEX = 0x1000
     SDO_SUBINDEX = 0x00
 
@@ -54,54 +65,121 @@ class NetworkLatencyTest:
         self.abort_event = None
 
     def run_measurement(self):
-        """Perform NUM_SAMPLES SDO reads and record round-trip time."""
+        """Perform WARMUP_READS untimed SDO reads, then NUM_SAMPLES timed
+        reads, recording the round-trip time of each."""
         slave = self.master.slaves[self.slave_index]
         self.latencies_ms = []
         errors = 0
-
-        for _ in range(self.NUM_SAMPLES):
-            if self.abort_event and self.abort_event.is_set():
-                return
-
-            t0 = time.perf_counter()
+        n = self.NUM_SAMPLES
+        # Raw integer nanoseconds; converted to ms once after the loop.
+        buf = [0] * n
+        count = 0
+        perf = time.perf_counter_ns
+        read = slave.sdo_read
+        index, subindex = self.SDO_INDEX, self.SDO_SUBINDEX
+        aborted = self.abort_event.is_set if self.abort_event else None
+        interval_ns = self.MIN_INTERVAL_US * 1000
+        attempts = 1 + self.SDO_RETRIES
+        monotonic = time.monotonic_ns
+        sleep = time.sleep
+        next_t = 0
+
+        for _ in range(self.WARMUP_READS):
             try:
-                slave.sdo_read(self.SDO_INDEX, self.SDO_SUBINDEX)
+                read(index, subindex)
             except Exception:
-                errors += 1
-                continue
-            t1 = time.perf_counter()
-            self.latencies_ms.append((t1 - t0) * 1000.0)
+                pass
+
+        try:
+            for _ in range(n):
+                if aborted and aborted():
+                    return
+                if interval_ns:
+                    delay = next_t - monotonic()
+                    if delay > 0:
+                        sleep(delay / 1e9)
+
+                backoff = 0.001
+                for _attempt in range(attempts):
+                    t0 = perf()
+                    try:
+                        read(index, subindex)
+                    except Exception:
+                        sleep(backoff)
+                        backoff *= 2
+                        continue
+                    buf[count] = perf() - t0
+                    count += 1
+                    break
+                else:
+                    errors += 1
+
+                if interval_ns:
+                    next_t = monotonic() + interval_ns
+        finally:
+            self.latencies_ms = [ns / 1e6 for ns in buf[:count]]
 
         if errors:
             print(f"[NET-TEST] {errors}/{self.NUM_SAMPLES} reads failed")
 
-    def analyze(self) -> dict | None:
-        """Return statistics dict or ``None`` if insufficient data."""
+    def analyze(self, histogram_bins=0, include_samples=True) -> dict | None:
+        """Return statistics dict or ``None`` if insufficient data.
+
+        Args:
+            histogram_bins: If > 0, add ``hist_counts`` / ``hist_edges``
+                (``histogram_bins`` equal-width bins from min to max).
+            include_samples: Include the raw ``samples`` list.  Turn off
+                when only the histogram is needed — it dominates the size
+                of the result for large runs.
+        """
         if len(self.latencies_ms) < 10:
             return None
 
         samples = self.latencies_ms
         n = len(samples)
+        # One sort serves min/max and all percentiles.
         sorted_s = sorted(samples)
-        mean = sum(samples) / n
+        mean = math.fsum(sorted_s) / n
         median = sorted_s[n // 2]
-        variance = sum((x - mean) ** 2 for x in samples) / n
-        std = variance ** 0.5
+        variance = math.fsum([(x - mean) ** 2 for x in sorted_s]) / n
+        std = math.sqrt(variance)
         p95 = sorted_s[int(n * 0.95)]
         p99 = sorted_s[int(n * 0.99)]
 
-        return {
-            "samples": [round(v, 3) for v in samples],
+        result = {
             "count": n,
             "errors": self.NUM_SAMPLES - n,
-            "min_ms": round(min(samples), 3),
-            "max_ms": round(max(samples), 3),
+            "min_ms": round(sorted_s[0], 3),
+            "max_ms": round(sorted_s[-1], 3),
             "mean_ms": round(mean, 3),
             "median_ms": round(median, 3),
             "std_ms": round(std, 3),
             "p95_ms": round(p95, 3),
             "p99_ms": round(p99, 3),
         }
+        if include_samples:
+            result["samples"] = [round(v, 3) for v in samples]
+        if histogram_bins > 0:
+            counts, edges = _histogram(sorted_s, histogram_bins)
+            result["hist_counts"] = counts
+            result["hist_edges"] = [round(e, 3) for e in edges]
+        return result
+
+
+def _histogram(sorted_samples, bins):
+    """Equal-width histogram of an ascending, non-empty sample list.
+
+    Returns ``(counts, edges)`` with ``bins`` counts and ``bins + 1`` edges.
+    The last bin is closed on the right so the maximum is counted.
+    """
+    lo = sorted_samples[0]
+    width = max(sorted_samples[-1] - lo, 0.001) / bins
+    counts = [0] * bins
+    last = bins - 1
+    for x in sorted_samples:
+        i = int((x - lo) / width)
+        counts[i if i < last else last] += 1
+    return counts, [lo + i * width for i in range(bins + 1)]
 
 
 def main():
@@ -7,10 +7,15 @@ via SDO writes.  Supports file-based (JSON) per-slave configuration.
 """
 
 import json
+import os
 import struct
-from pathlib import Path
 
 
+# Pre-compiled SDO payload layouts for the PDO assignment writes.
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_ZERO_U8 = b"\x00"
+
 DEFAULT_RX_PDO = [0x1600]
 DEFAULT_TX_PDO = [0x1A00]
 
@@ -94,16 +99,17 @@ def read_assigned_pdos(slave, assign_index):
     for sub in range(1, n_pdos + 1):
         try:
             raw = slave.sdo_read(assign_index, sub, 2)
-            assigned.append(struct.unpack("<H", raw[:2])[0])
         except Exception:
             continue
+        if len(raw) >= 2:
+            assigned.append(int.from_bytes(raw[:2], "little"))
     return assigned
 
 
 def clear_pdo_assignment(slave, assign_index):
     """Set PDO assign object (0x1C12 / 0x1C13) count to zero."""
     try:
-        slave.sdo_write(assign_index, 0, struct.pack("<B", 0))
+        slave.sdo_write(assign_index, 0, _ZERO_U8)
         return True
     except Exception:
         return False
@@ -246,6 +252,39 @@ def apply_startup_sdos(slave, entries, transition, name="?"):
     return done
 
 
+def read_config_file(path):
+    """Parse a JSON config file.
+
+    The file is read as bytes and handed to :func:`json.loads` directly,
+    which detects UTF-8 itself — no intermediate ``str`` copy of the file.
+    Raises ``OSError`` / ``ValueError`` on unreadable or malformed files.
+    """
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
+# path -> ((st_mtime_ns, st_size), parsed JSON) for read_config_cached().
+_CONFIG_CACHE = {}
+
+
+def read_config_cached(path):
+    """:func:`read_config_file`, memoized until the file changes on disk.
+
+    The cache entry is keyed on the file's mtime and size, so an edit (or a
+    save from the web GUI) is picked up on the next call.  The returned
+    dict is shared between callers and must not be modified.
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = _CONFIG_CACHE.get(path)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    raw = read_config_file(path)
+    _CONFIG_CACHE[path] = (stamp, raw)
+    return raw
+
+
 def load_pdo_config(path):
     """Load PDO mapping configuration from a JSON file.
 
@@ -288,7 +327,7 @@ def load_pdo_config(path):
         error.
     """
     try:
-        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        raw = read_config_cached(path)
     except Exception as exc:
         print(f"[PDO] Could not load {path}: {exc}")
         return None
@@ -433,20 +472,19 @@ def configure_pdo_mapping(slave, rx_pdo=None, tx_pdo=None, use_defaults=False):
         ``count:u8`` + pad + ``u16`` entries).  We try Complete Access first
         and fall back to the per-subindex method for terminals that reject CA.
         """
-        ca_payload = struct.pack("<BB", len(pdo_list), 0) + b"".join(
-            struct.pack("<H", p) for p in pdo_list
-        )
+        n = len(pdo_list)
+        ca_payload = struct.pack(f"<BB{n}H", n, 0, *pdo_list)
         if _try_sdo_write(assign_index, 0x00, ca_payload, ca=True):
             print(f"[PDO] {name}: {label} assigned via Complete Access "
                   f"{[f'0x{p:04X}' for p in pdo_list]}")
             return
 
-        if not _try_sdo_write(assign_index, 0x00, struct.pack("<B", 0)):
+        if not _try_sdo_write(assign_index, 0x00, _ZERO_U8):
             print(f"[PDO] {name}: 0x{assign_index:04X} ({label}) not writable, skipping")
             return
         for i, pdo in enumerate(pdo_list, start=1):
-            _sdo_write(assign_index, i, struct.pack("<H", pdo), f"{label}[{i}]=0x{pdo:04X}")
-        _sdo_write(assign_index, 0x00, struct.pack("<B", len(pdo_list)),
+            _sdo_write(assign_index, i, _U16.pack(pdo), f"{label}[{i}]=0x{pdo:04X}")
+        _sdo_write(assign_index, 0x00, _U8.pack(len(pdo_list)),
                    f"set {label} count={len(pdo_list)}")
         print(f"[PDO] {name}: {label} assigned via subindex writes "
               f"{[f'0x{p:04X}' for p in pdo_list]}")
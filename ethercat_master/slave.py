@@ -24,6 +24,8 @@ Usage::
     bus.close()
 """
 
+import threading
+
 from .pdo import configure_pdo_mapping
 
 
@@ -54,12 +56,29 @@ class GenericSlave:
         self._pysoem_slave = None
         self._input = b""
         self._output = b""
+        # True while _output still has to be copied into the process image.
+        self._output_dirty = False
+        self._zero_out = b""
+        # Set by the PDO thread whenever new input data arrives; callers
+        # wait() on it and clear() it after reading :attr:`input`.
+        self.input_ready = threading.Event()
 
     @property
     def input(self) -> bytes:
         """Latest PDO input data (slave -> master)."""
         return self._input
 
+    def input_into(self, out) -> int:
+        """Copy the latest input data into the writable buffer *out*
+        (e.g. a reused ``bytearray``) instead of returning a new object.
+
+        Returns the number of bytes copied: ``min(len(out), len(input))``.
+        """
+        data = self._input
+        n = min(len(out), len(data))
+        memoryview(out)[:n] = memoryview(data)[:n]
+        return n
+
     @property
     def output(self) -> bytes:
         """Current PDO output data (master -> slave)."""
@@ -68,6 +87,7 @@ class GenericSlave:
     @output.setter
     def output(self, data: bytes):
         self._output = data
+        self._output_dirty = True
 
     def configure(self, pysoem_slave, rx_pdo=None, tx_pdo=None):
         """Called by EtherCATBus during config_init.  Stores the pysoem
@@ -79,17 +99,34 @@ class GenericSlave:
     def seed_tx(self, pysoem_slave):
         """Called once after config_map to initialise the output buffer
         with zeros so the slave receives valid data on the first cycle."""
-        self._output = bytes(len(pysoem_slave.output))
+        self._output = self._zeros(len(pysoem_slave.output))
         pysoem_slave.output = self._output
+        self._output_dirty = False
 
     def pdo_update(self, master, reconnecting):
         """Internal callback — called automatically by EtherCATBus every
-        cycle.  Reads and writes the _input and _output buffers."""
+        cycle.  Reads and writes the _input and _output buffers.
+
+        Outputs are only copied into the process image after :attr:`output`
+        was assigned; the image keeps the last value between cycles.
+        """
         if reconnecting.is_set() or self._pysoem_slave is None:
             return
-        self._input = self._pysoem_slave.input
-        if self._output and len(self._output) == len(self._pysoem_slave.output):
-            self._pysoem_slave.output = self._output
+        data = self._pysoem_slave.input
+        if data != self._input:
+            self._input = data
+            self.input_ready.set()
+        if self._output_dirty:
+            # Clear the flag before reading _output: an assignment racing
+            # with the push below re-sets it and is written next cycle.
+            self._output_dirty = False
+            out = self._output
+            pysoem_slave = self._pysoem_slave
+            if out and len(out) == len(pysoem_slave.output):
+                pysoem_slave.output = out
+                # A bytearray may be edited in place, so keep pushing those.
+                if type(out) is not bytes:
+                    self._output_dirty = True
         if self.on_cycle:
             self.on_cycle(self)
 
@@ -97,9 +134,16 @@ class GenericSlave:
         """Called during bus shutdown.  Zeroes all outputs so the slave
         does not hold its last commanded state."""
         if self._pysoem_slave and len(self._pysoem_slave.output) > 0:
-            self._pysoem_slave.output = bytes(len(self._pysoem_slave.output))
+            self._pysoem_slave.output = self._zeros(len(self._pysoem_slave.output))
+
+    def _zeros(self, size):
+        """All-zero output buffer of *size* bytes, reused across calls."""
+        if len(self._zero_out) != size:
+            self._zero_out = bytes(size)
+        return self._zero_out
 
     def on_reconnect(self, master):
         """Called after the bus recovers from a connection loss.
         Re-acquires the pysoem slave reference which may have changed."""
         self._pysoem_slave = master.slaves[self.slave_index]
+        self._output_dirty = True
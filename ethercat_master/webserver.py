@@ -21,20 +21,21 @@ Then open http://localhost:8080 in your browser.
 import argparse
 import json
 import threading
+import time
 from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 
 try:
     from .bus import EtherCATBus
-    from .pdo import load_pdo_config, get_slave_pdo
+    from .pdo import load_pdo_config, get_slave_pdo, read_config_cached
     from .network_test import NetworkLatencyTest
     from .slave import GenericSlave
 except ImportError:
     import sys as _sys
     _sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     from ethercat_master.bus import EtherCATBus
-    from ethercat_master.pdo import load_pdo_config, get_slave_pdo
+    from ethercat_master.pdo import load_pdo_config, get_slave_pdo, read_config_cached
     from ethercat_master.network_test import NetworkLatencyTest
     from ethercat_master.slave import GenericSlave
 
@@ -47,7 +48,7 @@ def _load_net_config(pdo_config_path: str | None) -> dict:
     defaults = {"adapter": None, "cycle_ms": 1.0}
     try:
         if pdo_config_path and Path(pdo_config_path).exists():
-            raw = json.loads(Path(pdo_config_path).read_text(encoding="utf-8"))
+            raw = read_config_cached(pdo_config_path)
             net = raw.get("network", {})
             if "adapter" in net:
                 defaults["adapter"] = net["adapter"]
@@ -82,15 +83,18 @@ class BusState:
         self.cycle_time_ms = 1.0
         self.last_error = ""
         self._lock = threading.Lock()
+        # (monotonic time, encoded JSON) shared by /api/status and
+        # /api/connection; see status_json().
+        self._status_cache = (0.0, None)
 
     @property
     def state(self):
         """Return the current EtherCAT bus state as a string."""
-        if not self.bus or not self.bus.master:
+        bus = self.bus
+        master = bus.master if bus else None
+        if master is None:
             return "IDLE"
-        if self.bus.master.in_op:
-            return "OP"
-        return "PRE-OP"
+        return "OP" if master.in_op else "PRE-OP"
 
     @property
     def slave_count(self):
@@ -101,6 +105,28 @@ class BusState:
                 pass
         return 0
 
+    STATUS_TTL = 0.1  # seconds
+
+    def status_json(self) -> bytes:
+        """Encoded status snapshot for the polling endpoints.
+
+        Rebuilt at most every :attr:`STATUS_TTL` seconds (and right after
+        connect/disconnect), so several tabs or endpoints polling at once
+        share one response body.
+        """
+        now = time.monotonic()
+        t, data = self._status_cache
+        if data is None or now - t >= self.STATUS_TTL:
+            data = _json_encode({
+                "state": self.state,
+                "adapter": self.adapter_name,
+                "cycle": self.cycle_time_ms,
+                "slaves": self.slave_count,
+                "error": self.last_error,
+            }).encode("utf-8")
+            self._status_cache = (now, data)
+        return data
+
     def connect(self, adapter_name, cycle_time_ms):
         with self._lock:
             if self.bus and self.bus.master and self.bus.master.in_op:
@@ -131,6 +157,7 @@ class BusState:
                     self.bus.register_slave(handle)
 
             self.bus.open()
+            self._status_cache = (0.0, None)
             _save_net_config(self.pdo_config_path, adapter_name, cycle_time_ms)
 
     def disconnect(self):
@@ -142,6 +169,7 @@ class BusState:
                     pass
                 self.bus = None
             self.last_error = ""
+            self._status_cache = (0.0, None)
 
 
 _SKIP_ADAPTERS = (
@@ -151,10 +179,49 @@ _SKIP_ADAPTERS = (
 
 _SKIP_LINUX_IFACES = ("lo", "wlan", "wlp", "docker", "br-", "veth", "virbr")
 
+# Compact separators: the latency test returns hundreds of samples.  Built
+# once, since json.dumps() creates a new encoder for non-default options.
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _filtered_adapters() -> list[dict]:
+    """Usable network adapters as ``{"name", "desc"}`` dicts.
+
+    ``EtherCATBus.list_adapters()`` already caches the slow enumeration,
+    so only the cheap filtering runs per request.
+    """
+    skip_desc = _SKIP_ADAPTERS
+    skip_name = _SKIP_LINUX_IFACES
+    result = []
+    for a in EtherCATBus.list_adapters():
+        name = a.name.decode("utf-8", errors="replace") if isinstance(a.name, bytes) else str(a.name)
+        desc = a.desc.decode("utf-8", errors="replace") if isinstance(a.desc, bytes) else str(a.desc)
+        desc_lower = desc.lower()
+        if any(s in desc_lower for s in skip_desc):
+            continue
+        if name.startswith(skip_name):
+            continue
+        result.append({"name": name, "desc": desc})
+    return result
+
+
 bus_state: BusState = None  # set in main()
 
 _WEBGUI_DIR = Path(__file__).parent / "webgui"
 
+# filepath -> (st_mtime_ns, bytes) for the static GUI assets.
+_static_cache = {}
+
+
+def _read_static(filepath: Path) -> bytes:
+    """Return a static asset from memory, re-reading it only when its
+    mtime changes.  Raises ``FileNotFoundError`` for missing files."""
+    mtime = filepath.stat().st_mtime_ns
+    entry = _static_cache.get(filepath)
+    if entry is None or entry[0] != mtime:
+        entry = _static_cache[filepath] = (mtime, filepath.read_bytes())
+    return entry[1]
+
 
 # ---------------------------------------------------------------------------
 # HTTP Handler
@@ -162,6 +229,14 @@ _WEBGUI_DIR = Path(__file__).parent / "webgui"
 
 class _Handler(BaseHTTPRequestHandler):
 
+    # Keep-alive: the GUI polls /api/status continuously, so reuse one
+    # connection (and one handler thread) per browser instead of a new
+    # TCP connection and thread per request.  Every response therefore
+    # carries a Content-Length.
+    protocol_version = "HTTP/1.1"
+    # Close idle keep-alive connections (and their threads) after a while.
+    timeout = 15
+
     def do_GET(self):
         parsed = urlparse(self.path)
         path = parsed.path
@@ -177,18 +252,8 @@ class _Handler(BaseHTTPRequestHandler):
 
         if path == "/api/adapters":
             try:
-                adapters = EtherCATBus.list_adapters()
-                result = []
-                for a in adapters:
-                    name = a.name.decode("utf-8", errors="replace") if isinstance(a.name, bytes) else str(a.name)
-                    desc = a.desc.decode("utf-8", errors="replace") if isinstance(a.desc, bytes) else str(a.desc)
-                    if any(s in desc.lower() for s in _SKIP_ADAPTERS):
-                        continue
-                    if any(name.startswith(p) for p in _SKIP_LINUX_IFACES):
-                        continue
-                    result.append({"name": name, "desc": desc})
                 self._send_json({
-                    "adapters": result,
+                    "adapters": _filtered_adapters(),
                     "current": bus_state.adapter_name,
                     "state": bus_state.state,
                 })
@@ -220,24 +285,8 @@ class _Handler(BaseHTTPRequestHandler):
             self._send_json({"ok": True, "state": "IDLE"})
             return
 
-        if path == "/api/status":
-            self._send_json({
-                "state": bus_state.state,
-                "adapter": bus_state.adapter_name,
-                "cycle": bus_state.cycle_time_ms,
-                "slaves": bus_state.slave_count,
-                "error": bus_state.last_error,
-            })
-            return
-
-        if path == "/api/connection":
-            self._send_json({
-                "state": bus_state.state,
-                "adapter": bus_state.adapter_name,
-                "cycle": bus_state.cycle_time_ms,
-                "slaves": bus_state.slave_count,
-                "error": bus_state.last_error,
-            })
+        if path in ("/api/status", "/api/connection"):
+            self._send_json_bytes(bus_state.status_json())
             return
 
         if path == "/api/discover":
@@ -262,10 +311,12 @@ class _Handler(BaseHTTPRequestHandler):
             try:
                 slave_idx = int(query.get("slave", ["0"])[0])
                 num_samples = int(query.get("samples", ["200"])[0])
+                bins = min(int(query.get("histogram_bins", ["20"])[0]), 1000)
+                raw = query.get("raw", ["0"])[0] == "1"
                 test = NetworkLatencyTest(bus_state.bus.master, slave_index=slave_idx)
                 test.NUM_SAMPLES = num_samples
                 test.run_measurement()
-                metrics = test.analyze()
+                metrics = test.analyze(histogram_bins=bins, include_samples=raw)
                 if metrics is None:
                     self._send_json({"error": "Insufficient data captured"})
                 else:
@@ -278,8 +329,7 @@ class _Handler(BaseHTTPRequestHandler):
             cfg_path = bus_state.pdo_config_path
             if cfg_path and Path(cfg_path).exists():
                 try:
-                    raw = json.loads(Path(cfg_path).read_text(encoding="utf-8"))
-                    self._send_json(raw)
+                    self._send_json(read_config_cached(cfg_path))
                 except Exception as exc:
                     self._send_json({"error": str(exc)})
             else:
@@ -332,28 +382,36 @@ class _Handler(BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
     def _send_json(self, obj):
-        data = json.dumps(obj).encode("utf-8")
+        self._send_json_bytes(_json_encode(obj).encode("utf-8"))
+
+    def _send_json_bytes(self, data: bytes):
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
 
     def _send_file(self, filepath: Path, content_type: str):
         try:
-            data = filepath.read_bytes()
+            data = _read_static(filepath)
         except FileNotFoundError:
             self.send_error(404)
             return
         self.send_response(200)
         self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "max-age=60")
         self.end_headers()
         self.wfile.write(data)
 
     def log_message(self, fmt, *args):
+        if fmt.startswith("Request timed out"):
+            return  # idle keep-alive connection closed, not an error
         first = str(args[0]) if args else ""
         if "/api/" not in first:
             super().log_message(fmt, *args)
@@ -395,6 +453,12 @@ def main():
     bus_state.adapter_name = adapter
     bus_state.cycle_time_ms = float(net_cfg["cycle_ms"])
 
+    for asset in ("index.html", "style.css"):
+        try:
+            _read_static(_WEBGUI_DIR / asset)
+        except OSError:
+            pass
+
     server = ThreadingHTTPServer(("0.0.0.0", args.port), _Handler)
     print(f"EtherCAT Master Web Server running on http://localhost:{args.port}")
     try:
@@ -403,6 +467,7 @@ def main():
         print("\nShutting down...")
         bus_state.disconnect()
         server.shutdown()
+        server.server_close()
 
 
 if __name__ == "__main__":
@@ -2,31 +2,79 @@
 Minimal example: connect to one EtherCAT slave using ethercat_config.json
 """
 
+import os
+import signal
+import sys
+import threading
 import time
 from ethercat_master import EtherCATBus, GenericSlave
 
 SLAVE = 0
+PERIOD_S = 0.1  # display refresh
+
+
+def _s(x):
+    """Adapter name/desc as str (pysoem returns bytes on some platforms)."""
+    return x.decode("utf-8", errors="replace") if type(x) is bytes else str(x)
+
+
+if os.name == "nt":
+    def _status(line):
+        # Windows consoles go through sys.stdout for newline/console handling.
+        sys.stdout.write(line.decode("ascii"))
+        sys.stdout.flush()
+else:
+    def _status(line):
+        # One unbuffered write, bypassing TextIOWrapper encode + lock.
+        os.write(1, line)
+
 
 print("Available adapters:")
 for a in EtherCATBus.list_adapters():
-    name = a.name.decode("utf-8", errors="replace") if isinstance(a.name, bytes) else str(a.name)
-    desc = a.desc.decode("utf-8", errors="replace") if isinstance(a.desc, bytes) else str(a.desc)
-    print(f"  {desc}  ->  {name}")
+    print(f"  {_s(a.desc)}  ->  {_s(a.name)}")
 
 slave = GenericSlave(SLAVE, use_default_pdo=False)
-bus = EtherCATBus(pdo_config_path="ethercat_config.json")
+# realtime=True runs the ProcessData thread under SCHED_FIFO and locks memory
+# (Linux only; ignored elsewhere).  For a stable 1 ms cycle also:
+#   - boot with isolcpus=3 (PREEMPT_RT kernel) and pass rt_cpu=3
+#   - stop irqbalance and move NIC IRQs off that CPU via /proc/irq/<n>/smp_affinity
+bus = EtherCATBus(pdo_config_path="ethercat_config.json", realtime=True)
 bus.register_slave(slave)
 bus.open()
 
-print("Connected! Reading PDO data (Ctrl+C to stop)\n")
+print("Connected! Reading PDO data (Ctrl+C to stop)\n", flush=True)
+
+# Ctrl+C only sets a flag; the loop notices it within one period (the wait
+# below returns early) and shuts down without unwinding an exception.
+stop = threading.Event()
+signal.signal(signal.SIGINT, lambda *_: stop.set())
+if hasattr(signal, "SIGBREAK"):  # Ctrl+Break on Windows
+    signal.signal(signal.SIGBREAK, lambda *_: stop.set())
 
 try:
-    while True:
-        data = slave.input
-        if data:
-            print(f"  RX ({len(data)}B): {data[:16].hex(' ')} ...", end="\r")
-        time.sleep(0.1)
-except KeyboardInterrupt:
+    # Sleep until the bus reports new input (the timeout only bounds how
+    # long a Ctrl+C can go unnoticed), then redraw at most every PERIOD_S
+    # on an absolute-deadline grid.
+    deadline = time.monotonic()
+    buf = bytearray(16)  # reused for the displayed head of the input PDO
+    view = memoryview(buf)
+    prev = None
+    while not stop.is_set():
+        if not slave.input_ready.wait(PERIOD_S):
+            continue
+        slave.input_ready.clear()
+        n = slave.input_into(buf)
+        # Only redraw when the displayed bytes changed.
+        head = view[:n]
+        if n and head != prev:
+            _status(b"  RX (%dB): %s ...\r" % (len(slave.input), head.hex(" ").encode("ascii")))
+            prev = bytes(head)
+        deadline += PERIOD_S
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            stop.wait(delay)
+        else:
+            deadline = time.monotonic()  # fell behind, resync
     print("\n\nDisconnecting...")
 finally:
     bus.close()
@@ -16,8 +16,14 @@ import time
 from ethercat_master import EtherCATBus, GenericSlave
 from hdrive_etc import HDriveETC, Mode
 
+CONFIG = "ethercat_config.json"
+
+ALL_ON = b"\xff"    # EL2008: all 8 outputs on
+
 # -- Create shared bus --
-bus = EtherCATBus(pdo_config_path="ethercat_config.json")
+# realtime=True: SCHED_FIFO + mlockall on Linux (see "Real-time scheduling"
+# in the README for CPU isolation and IRQ affinity).
+bus = EtherCATBus(pdo_config_path=CONFIG, realtime=True)
 
 # -- HDrive motor on slave 0 --
 motor = HDriveETC(slave_index=0, bus=bus)
@@ -25,8 +31,7 @@ motor = HDriveETC(slave_index=0, bus=bus)
 # -- Beckhoff terminals on slaves 2, 3 (slave 1 = EK1100 coupler, skip) --
 dio = GenericSlave(2)
 din = GenericSlave(3)
-bus.register_slave(dio)
-bus.register_slave(din)
+bus.register_slaves([dio, din])
 
 # -- Connect --
 bus.open()
@@ -37,11 +42,13 @@ print(f"Motor position: {motor.get_position()}°")
 
 motor.set_mode(Mode.VELOCITY)
 motor.set_velocity(1000) # 1000 rad/s
+
 time.sleep(2)
 motor.stop()
+print(f"Motor position after run: {motor.get_position()}°")
 
 # -- Use Beckhoff terminals (uncomment above first) --
-dio.output = bytes([0xFF])         # all digital outputs ON
+dio.output = ALL_ON                # all digital outputs ON
 print(f"DIN: {din.input.hex()}")   # read digital inputs
 
 bus.close()